@@ -0,0 +1,130 @@
+"""Excel loading shared by the station dashboards.
+
+Sheets are parsed with the fastest available backend and kept as Parquet copies under
+CACHE_DIR, keyed by workbook name and content hash, so each xlsx version is parsed once.
+"""
+import functools
+import hashlib
+import logging
+import os
+import tempfile
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import streamlit as st
+
+CACHE_DIR = ".cache"  # Parquet copies of parsed workbooks, keyed by file hash
+
+logger = logging.getLogger(__name__)
+
+# Excel parser backend: python-calamine (Rust-based, much faster) when installed,
+# otherwise openpyxl in streaming read-only mode
+try:
+    from python_calamine import CalamineWorkbook
+    EXCEL_ENGINE = "calamine"
+except ImportError:
+    import openpyxl
+    CalamineWorkbook = None
+    EXCEL_ENGINE = "openpyxl"
+
+
+def list_sheet_names(filepath):
+    """Return the sheet names of a workbook without parsing any sheet."""
+    if CalamineWorkbook is not None:
+        return CalamineWorkbook.from_path(filepath).sheet_names
+    wb = openpyxl.load_workbook(filepath, read_only=True)
+    try:
+        return wb.sheetnames
+    finally:
+        wb.close()
+
+def read_excel_sheet(filepath, position=0):
+    """Parse one sheet (by position) into a DataFrame with the fastest available backend."""
+    if CalamineWorkbook is not None:
+        return pd.read_excel(filepath, sheet_name=position, engine=EXCEL_ENGINE)
+    # read_only mode streams rows instead of building the whole workbook DOM in memory
+    wb = openpyxl.load_workbook(filepath, read_only=True, data_only=True)
+    try:
+        rows = wb.worksheets[position].iter_rows(values_only=True)
+        header = next(rows, ())
+        return pd.DataFrame(list(rows), columns=header)
+    finally:
+        wb.close()
+
+def file_stamp(filepath):
+    """Return (mtime, size) for a file, used to key caches so an edited workbook is reloaded."""
+    stat = os.stat(filepath)
+    return stat.st_mtime, stat.st_size
+
+def cache_by_file_stamp(loader):
+    """st.cache_data for a loader that takes a file path, keyed on the path plus the file's
+    (mtime, size) so an edited workbook is reloaded."""
+    def stamped(filepath, stamp):
+        return loader(filepath)
+    # Streamlit keys the cache on the function's name and source; take both from the loader
+    functools.update_wrapper(stamped, loader)
+    cached = st.cache_data(stamped)
+
+    @functools.wraps(loader)
+    def load(filepath):
+        return cached(filepath, file_stamp(filepath))
+    return load
+
+def get_cache_dir(filepath):
+    """Return the Parquet cache directory for a workbook, keyed by file name and content hash."""
+    with open(filepath, 'rb') as f:
+        file_hash = hashlib.blake2b(f.read()).hexdigest()[:16]
+    return os.path.join(CACHE_DIR, f"{os.path.basename(filepath)}.{file_hash}")
+
+def _matching_columns(names, columns):
+    """Names (in sheet order) whose stripped header is one of the requested columns."""
+    return [name for name in names if str(name).strip() in columns]
+
+def cached_read_excel(filepath, position=0, cache_dir=None, columns=None, dtype_backend=None):
+    """pd.read_excel for one sheet, backed by a Parquet copy so the xlsx is parsed only once.
+
+    columns limits the result to headers that match once stripped (missing ones are skipped;
+    the names come back as stored). dtype_backend='pyarrow' returns Arrow-backed columns.
+    A freshly parsed sheet is read back from its Parquet copy, so column types are the same
+    whether or not the cache was hit.
+    """
+    cache_dir = cache_dir or get_cache_dir(filepath)
+    # Sheets are stored by position so sheet names never have to be valid file names
+    parquet_path = os.path.join(cache_dir, f"{position}.parquet")
+    if not os.path.exists(parquet_path):
+        table = pa.Table.from_pandas(read_excel_sheet(filepath, position))
+        if not _write_parquet(table, cache_dir, parquet_path):
+            # No cache file to read back; the in-memory table goes through the same conversion
+            if columns is not None:
+                table = table.select(_matching_columns(table.column_names, columns))
+            return _to_frame(table, dtype_backend)
+
+    if columns is not None:
+        columns = _matching_columns(pq.read_schema(parquet_path).names, columns)
+    return _to_frame(pq.read_table(parquet_path, columns=columns), dtype_backend)
+
+def _write_parquet(table, cache_dir, parquet_path):
+    """Write a sheet's Parquet copy; returns False (and logs) if the cache could not be written."""
+    tmp_path = None
+    try:
+        # Write to a unique temp file, then rename, so a half-written file is never treated
+        # as a cache hit even when two sessions parse the same workbook at once
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        os.close(fd)
+        pq.write_table(table, tmp_path, compression="zstd")
+        os.replace(tmp_path, parquet_path)
+        return True
+    except Exception as e:
+        # Cache is best-effort; the parsed data is still returned
+        logger.warning("Could not cache %s as Parquet: %s", parquet_path, e)
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return False
+
+def _to_frame(table, dtype_backend):
+    """DataFrame from an Arrow table, Arrow-backed when dtype_backend='pyarrow'."""
+    if dtype_backend == 'pyarrow':
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+    return table.to_pandas()
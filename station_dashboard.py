@@ -1,195 +1,182 @@
 import streamlit as st
 import pandas as pd
-import plotly.graph_objects as go
-from datetime import datetime, timedelta
+from datetime import datetime
 import folium
-from streamlit_folium import folium_static
 import os
+import hashlib
+import html
 import numpy as np 
+from excel_cache import cache_by_file_stamp, cached_read_excel
+from station_map import add_station_markers
 
 # --- FILE CONFIGURATION ---
 LOCATION_FILE = "Location1.xlsx" 
 DETAIL_FILE = "station information1.xlsx" 
+STYLE_FILE = "style.css"
+CLUSTER_THRESHOLD = 200  # Above this many stations, markers are clustered instead of drawn individually
 # --- END FILE CONFIGURATION ---
 
+# Normalized station status levels; anything else is stored as 'unknown'
+STATUS_LEVELS = ['active', 'dead', 'unknown']
+# List icon and marker colour per status level, indexed by status code (position in STATUS_LEVELS)
+STATUS_ICONS = np.array(["🟢", "🔴", "⚪"])
+STATUS_COLORS = np.array(['green', 'red', 'gray'])
+
 st.set_page_config(
     page_title="Station Monitoring Dashboard",
     page_icon="🌊",
     layout="wide",
 )
 
-# Custom CSS (Retaining the layout and centering styles)
-st.markdown("""
-<style>
-    .main {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-    }
-    
-    .station-card {
-        background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%);
-        padding: 10px;
-        border-radius: 8px;
-        margin-bottom: 8px;
-        border-left: 4px solid #3498db;
-        cursor: pointer;
-    }
-    .station-card:hover {
-        transform: translateX(5px);
-        box-shadow: 0 4px 12px rgba(0,0,0,0.15);
-    }
-    .status-badge-active {
-        background-color: #4caf50;
-        color: white;
-        padding: 3px 8px;
-        border-radius: 12px;
-        font-size: 0.75em;
-        font-weight: bold;
-    }
-    .status-badge-dead {
-        background-color: #9D2C3E;
-        color: white;
-        padding: 3px 8px;
-        border-radius: 12px;
-        font-size: 0.75em;
-        font-weight: bold;
-    }
-    
-    /* DEFAULT METRIC SIZE (For Map/List View) */
-    div[data-testid="stMetricValue"] {
-        font-size: 2rem;
-    }
-    
-    /* 🔑 KEY: Targeted CSS for the Detail View Metrics (Smaller Text) */
-    .detail-metrics-container div[data-testid="stMetricValue"] {
-        font-size: 1.2rem; /* Reduced size for detail view values */
-        font-weight: bold;
-    }
-    .detail-metrics-container div[data-testid="stMetricLabel"] > div {
-        font-size: 0.7rem; /* Reduced size for detail view labels */
-        font-weight: normal;
-    }
+# Custom CSS (Retaining the layout and centering styles), kept in STYLE_FILE
+@st.cache_resource
+def _css():
+    """Read the stylesheet once per process"""
+    with open(STYLE_FILE, encoding='utf-8') as f:
+        return f.read()
 
-    /* Global Streamlit UI Cleanup */
-    .stApp > header {
-        display: none; 
-    }
-    div.block-container {
-        padding-top: 3rem; 
-        padding-bottom: 0rem;
-        padding-left: 2rem;
-        padding-right: 2rem;
-    }
-    /* Centering the main title (H1) */
-    h1 {
-        text-align: center; 
-        margin-top: 0rem !important;
-        padding-top: 0rem !important;
-        padding-bottom: 1rem; 
-    }
-    
-    div[data-testid="stMetric"] {
-        text-align: center; 
-    }
-
-    /* KEY CHANGES FOR GAP REDUCTION */
-    h3 {
-        margin-top: 0.5rem !important; 
-        margin-bottom: 0.5rem !important;
-    }
-    h2 {
-        margin-top: 0.5rem !important;
-        margin-bottom: 0.5rem !important;
-    }
-    
-    /* Make the station list scrollable in the 1/3 columns */
-    .station-list-container {
-        max-height: 80vh; 
-        overflow-y: auto;
-        padding-right: 10px;
-        padding-left: 5px; 
-    }
-    /* Reduce internal spacing within the list columns */
-    div[data-testid="stVerticalBlock"] {
-        gap: 0.5rem; 
-    }
-    
-    /* Center the Station List Title */
-    .list-title-container {
-        text-align: center;
-        width: 100%;
-        margin-top: 0.5rem; 
-    }
-</style>
-""", unsafe_allow_html=True)
+st.markdown(f"<style>{_css()}</style>", unsafe_allow_html=True)
 
 # Initialize session state
 if 'selected_station' not in st.session_state:
     st.session_state.selected_station = None
 if 'stations_data' not in st.session_state:
     st.session_state.stations_data = None
-if 'detail_data' not in st.session_state: 
-    st.session_state.detail_data = None
+if 'detail_index' not in st.session_state: 
+    st.session_state.detail_index = None
+
 
+def frame_fingerprint(df):
+    """Short content hash of a DataFrame, used as its cache key.
 
-@st.cache_data
+    The frame passed in is always hashed, since attrs are carried over to filtered copies.
+    """
+    return hashlib.blake2b(pd.util.hash_pandas_object(df, index=True).values.tobytes(), digest_size=8).hexdigest()
+
+@cache_by_file_stamp
 def load_map_data(filepath):
     """Load Map/List data (5 columns) from Location1.xlsx"""
     try:
-        df = pd.read_excel(filepath)
-        df.columns = df.columns.str.strip()
-        
         # Required columns for Map/List View
         required_cols = ['Station Name', 'Adress', 'Lat', 'Lon', 'Status']
         
+        # Only load the required columns from the shared Parquet cache
+        df = cached_read_excel(filepath, columns=required_cols, dtype_backend='pyarrow')
+        df.columns = [str(col).strip() for col in df.columns]
+        
         missing_cols = [col for col in required_cols if col not in df.columns]
         if missing_cols:
             st.error(f"Missing required columns in {filepath}: {', '.join(missing_cols)}")
             return None
 
-        return df[required_cols]
+        df = df[required_cols].copy()
+        # Arrow-backed strings: contiguous buffers and C string kernels instead of Python objects
+        text_cols = ['Station Name', 'Adress', 'Status']
+        df[text_cols] = df[text_cols].astype('string[pyarrow]')
+        # Normalized status as a categorical, computed once so comparisons are integer-code checks
+        status_lc = df['Status'].astype(str).str.strip().str.lower()
+        df['_status_lc'] = status_lc.where(status_lc.isin(STATUS_LEVELS), 'unknown').astype(
+            pd.CategoricalDtype(STATUS_LEVELS)
+        )
+        # Dense 0/1/2 status codes, so icons and colours are plain array lookups
+        df['_status_code'] = df['_status_lc'].cat.codes.astype(np.uint8)
+        # Summary metrics, computed once here instead of on every rerun
+        df.attrs['total'] = len(df)
+        df.attrs['active_count'] = int((df['_status_code'] == 0).sum())
+        return df
         
     except Exception as e:
         st.error(f"Error loading map data from {filepath}: {e}")
         return None
 
-@st.cache_data
+@cache_by_file_stamp
 def load_detail_data(filepath):
     """Load Detail data (8 columns) from Station information.xlsx"""
     try:
-        df = pd.read_excel(filepath)
-        df.columns = df.columns.str.strip()
-        
         # Required columns for Detail View
         required_cols = ['Station Name', 'Adress', 'Lat', 'Lon', 'Status', 'Type', 'Starting date', 'Last updated']
         
+        # Only load the required columns from the shared Parquet cache
+        df = cached_read_excel(filepath, columns=required_cols, dtype_backend='pyarrow')
+        df.columns = [str(col).strip() for col in df.columns]
+        
         missing_cols = [col for col in required_cols if col not in df.columns]
         if missing_cols:
             st.error(f"Missing required columns in {filepath}: {', '.join(missing_cols)}")
             return None
         
-        # Set 'Station Name' as the index for quick lookups later
-        df = df.set_index('Station Name', drop=False)
+        # Compact dtypes: Arrow strings for free text, categories for the few Status/Type values
+        df = df.astype({
+            'Station Name': 'string[pyarrow]',
+            'Adress': 'string[pyarrow]',
+            'Status': 'category',
+            'Type': 'category',
+        })
+        
+        # Coordinate display strings, formatted once here instead of on every detail rerun
+        for col in ['Lat', 'Lon']:
+            values = pd.to_numeric(df[col], errors='coerce')
+            df[f'{col}_fmt'] = values.map('{:.4f}'.format).where(values.notna(), 'N/A')
+        
+        # Dates parsed and formatted once (each cell on its own, like a per-value
+        # pd.to_datetime). Unparseable cells keep their raw text; a missing Last updated
+        # stays None so the detail view can show today's date instead
+        for col in ['Starting date', 'Last updated']:
+            raw = df[col].astype(object)
+            dates = pd.to_datetime(raw, errors='coerce', format='mixed')
+            raw_text = raw.map(str).astype(object).where(raw.notna(), None)
+            df[col] = dates.dt.strftime('%Y-%m-%d').astype(object).where(dates.notna(), raw_text)
+        df['Starting date'] = df['Starting date'].fillna('N/A')
+        
         return df
         
     except Exception as e:
         st.error(f"Error loading detail data from {filepath}: {e}")
         return None
 
-def get_station_icon(status):
-    """Return emoji icon based on status"""
-    if pd.notna(status) and 'active' in str(status).lower():
-        return "🟢"
-    return "🔴"
+def build_detail_index(detail_df):
+    """Map each Station Name to a plain dict of its detail fields, for O(1) lookups on click"""
+    return dict(zip(detail_df['Station Name'], detail_df.to_dict('records')))
+
+def display_value(value, default='N/A'):
+    """Text for a detail cell; missing values (None/NA from to_dict('records')) become default"""
+    return default if value is None or pd.isna(value) else value
+
+def build_detail_table_html(station, today_date_str):
+    """Render the station detail fields as a single HTML table (5 rows with 1 or 2 fields)"""
+    rows = [
+        [("Station Name", display_value(station.get('Station Name')))],
+        [("Adress", display_value(station.get('Adress')))],
+        [("Type", display_value(station.get('Type')))],
+        # Coordinates and dates are preformatted in load_detail_data
+        [("Latitude", station['Lat_fmt']), ("Longitude", station['Lon_fmt'])],
+        # If Last Updated is missing/NaN, use today's date
+        [("Starting Date", display_value(station['Starting date'])),
+         ("Last Updated", display_value(station['Last updated'], today_date_str))],
+    ]
+    body = "".join(
+        "<tr>" + "".join(
+            f'<td colspan="{2 // len(fields)}"><div class="detail-label">{label}</div>'
+            f'<div class="detail-value">{html.escape(str(value))}</div></td>'
+            for label, value in fields
+        ) + "</tr>"
+        for fields in rows
+    )
+    return f'<table class="detail-tbl">{body}</table>'
+
+def get_station_icons(status_code):
+    """Return emoji icons for a column of status codes"""
+    return pd.Series(STATUS_ICONS[status_code.to_numpy()], index=status_code.index)
 
 def create_map(stations_df):
     """Create a folium map with station markers, using only available data"""
-    if stations_df is None or len(stations_df) == 0:
+    if stations_df is None or stations_df.empty:
         return None
     
     # Filter out NaNs for better centering
     valid_stations = stations_df.dropna(subset=['Lat', 'Lon'])
     
-    if len(valid_stations) == 0:
+    if valid_stations.empty:
         st.warning("No stations with valid latitude and longitude found to display on map.")
         # Default to a safe location if no valid data
         center_lat, center_lon, zoom = 0, 0, 2
@@ -201,68 +188,82 @@ def create_map(stations_df):
     m = folium.Map(
         location=[center_lat, center_lon],
         zoom_start=zoom, 
-        tiles='OpenStreetMap'
+        tiles='OpenStreetMap',
+        prefer_canvas=True  # Draw vector markers on one canvas instead of N SVG nodes
     )
     
-    for idx, row in stations_df.iterrows():
-        if pd.notna(row['Lat']) and pd.notna(row['Lon']):
-            status = row.get('Status', 'Unknown')
-            icon_color = 'green' if status.lower() == 'active' else 'red'
-            
-            popup_html = f"""
-            <div style="font-family: Arial; width: 200px;">
-                <h4>{row.get('Station Name', 'Unknown')}</h4>
-                <b>Adress:</b> {row.get('Adress', 'N/A')}<br>
-                <b>Status:</b> {status}<br>
-            </div>
-            """
-            
-            folium.Marker(
-                location=[row['Lat'], row['Lon']],
-                popup=folium.Popup(popup_html, max_width=250),
-                tooltip=row.get('Station Name', 'Unknown'),
-                icon=folium.Icon(color=icon_color)
-            ).add_to(m)
+    if valid_stations.empty:
+        return m
+    
+    # Popups, tooltips and colours come from vectorized string ops; no per-marker Python objects
+    names = valid_stations['Station Name'].fillna('Unknown').astype(str)
+    status = valid_stations['Status'].fillna('Unknown').astype(str)
+    markers = pd.DataFrame({
+        'Lat': valid_stations['Lat'], 'Lon': valid_stations['Lon'],
+        'name': names,
+        'adress': valid_stations['Adress'].fillna('N/A').astype(str),
+        'status': status,
+        'color': STATUS_COLORS[valid_stations['_status_code'].to_numpy()],
+        'tooltip': names + ' - ' + status,
+    })
+    add_station_markers(m, markers, {'Station': 'name', 'Adress': 'adress', 'Status': 'status'}, CLUSTER_THRESHOLD)
     
     return m
 
-def render_list_column(df_slice, column):
-    """Renders a slice of the station list into a given Streamlit column."""
-    with column:
-        st.markdown("<div class='station-list-container'>", unsafe_allow_html=True)
-        for idx, station in df_slice.iterrows():
-            station_name = station.get('Station Name', 'Unknown')
-            adress = station.get('Adress', 'N/A')
-            status = station.get('Status', 'Unknown')
-            icon = get_station_icon(status)
-            
-            # Using the station-card class for a visual effect
-            if st.button(
-                f"{icon} {station_name}",
-                key=f"station_{idx}",
-                use_container_width=True
-            ):
-                # When clicked, select the full detail data based on Station Name
-                try:
-                    # Retrieve the row as a Series (which behaves like a dict)
-                    st.session_state.selected_station = st.session_state.detail_data.loc[station_name]
-                except KeyError:
-                    st.session_state.selected_station = None
-                    st.error(f"Error: Detail information for station '{station_name}' not found in {DETAIL_FILE}.")
-                    
-                st.rerun() 
-            
-            st.caption(f"Adress: {adress}")
-            
-            # Use appropriate status badge
-            if status.lower() == 'active':
-                st.markdown('<span class="status-badge-active">Active</span>', unsafe_allow_html=True)
-            elif status.lower() == 'dead':
-                st.markdown('<span class="status-badge-dead">Dead</span>', unsafe_allow_html=True)
-            
-            st.markdown("---")
+@st.cache_data(hash_funcs={pd.DataFrame: frame_fingerprint})
+def build_map_html(stations_df):
+    """Build the station map and return its rendered HTML, reused across reruns"""
+    station_map = create_map(stations_df)
+    if station_map is None:
+        return None
+    return folium.Figure().add_child(station_map).render()
+
+# Status cell styles, matching the status badge colours
+STATUS_STYLES = {
+    'active': 'background-color: #4caf50; color: white; font-weight: bold;',
+    'dead': 'background-color: #9D2C3E; color: white; font-weight: bold;',
+}
+
+@st.cache_data(hash_funcs={pd.DataFrame: frame_fingerprint})
+def build_list_view(stations_df):
+    """Precompute the list table (icon-prefixed names) and its status cell styles once per data version"""
+    display_df = stations_df[['Station Name', 'Adress', 'Status']].copy()
+    display_df['Station Name'] = get_station_icons(stations_df['_status_code']) + ' ' + display_df['Station Name'].astype(str)
+    status_css = stations_df['_status_lc'].map(STATUS_STYLES).fillna('')
+    return display_df, status_css
+
+@st.fragment
+def render_station_list(stations_df, key):
+    """Renders the station list as one selectable table (a fragment: a row click reruns only the table)"""
+    display_df, status_css = build_list_view(stations_df)
+    event = st.dataframe(
+        display_df.style.apply(lambda _: status_css, subset=['Status']),
+        width='stretch',
+        height=600,
+        hide_index=True,
+        column_config={
+            'Station Name': st.column_config.TextColumn('Station'),
+            'Adress': st.column_config.TextColumn('Adress'),
+            'Status': st.column_config.TextColumn('Status', width='small'),
+        },
+        on_select='rerun',
+        selection_mode='single-row',
+        key=key,
+    )
+    
+    if event.selection.rows:
+        station_name = stations_df.iloc[event.selection.rows[0]]['Station Name']
+        # When a row is selected, select the full detail data based on Station Name
+        try:
+            # Plain dict lookup; the detail DataFrame itself is not kept in session state
+            st.session_state.selected_station = st.session_state.detail_index[station_name]
+        except KeyError:
+            st.session_state.selected_station = None
+            st.error(f"Error: Detail information for station '{station_name}' not found in {DETAIL_FILE}.")
+            return
             
-        st.markdown("</div>", unsafe_allow_html=True)
+        # One full-app rerun to switch to the detail view
+        st.rerun() 
 
 
 # Main App
@@ -271,15 +272,17 @@ def main():
     st.title("🌊 Observation Station Monitor")
 
     # --- AUTOMATIC DATA LOADING START ---
-    if st.session_state.stations_data is None or st.session_state.detail_data is None:
+    if st.session_state.stations_data is None or st.session_state.detail_index is None:
         if os.path.exists(LOCATION_FILE) and os.path.exists(DETAIL_FILE):
             with st.spinner("Reading data from repository..."):
                 # Load Map/List Data (Location1.xlsx - 5 columns)
                 st.session_state.stations_data = load_map_data(LOCATION_FILE)
                 # Load Detail Data (Station information.xlsx - 8 columns)
-                st.session_state.detail_data = load_detail_data(DETAIL_FILE)
+                detail_df = load_detail_data(DETAIL_FILE)
+                if detail_df is not None:
+                    st.session_state.detail_index = build_detail_index(detail_df)
             
-            if st.session_state.stations_data is None or st.session_state.detail_data is None:
+            if st.session_state.stations_data is None or st.session_state.detail_index is None:
                 st.error("Failed to read required data files or missing columns. Check console for details.")
                 st.stop()
         else:
@@ -301,39 +304,22 @@ def main():
         # 📌 MAP/LIST VIEW (50% Map / 50% List)
         # ----------------------------------------------------------------------
         
-        # Step 1: Main 50/50 split for Header Alignment
-        col_map_header_spacer, col_list_header = st.columns([3, 3]) # 50% / 50%
-        
-        with col_list_header:
-              st.markdown('<div class="list-title-container"><h3>🏢 Station List</h3></div>', unsafe_allow_html=True)
+        # Main 50/50 split: map and metrics on the left, the station list on the right
+        col_main_content, col_list = st.columns([3, 3])
     
-        # Step 2: Main 50/16.67/16.67/16.67 content split
-        col_main_content, col_list_1, col_list_2, col_list_3 = st.columns([3, 1, 1, 1]) 
-    
-        # --- 50% COLUMNS: Split Station List Content ---
-        if stations_df is not None:
-            total_stations = len(stations_df)
-            split_point_1 = total_stations // 3
-            split_point_2 = 2 * (total_stations // 3)
-            
-            df_part_1 = stations_df.iloc[:split_point_1]
-            df_part_2 = stations_df.iloc[split_point_1:split_point_2]
-            df_part_3 = stations_df.iloc[split_point_2:]
-    
-            render_list_column(df_part_1, col_list_1)
-            render_list_column(df_part_2, col_list_2)
-            render_list_column(df_part_3, col_list_3)
+        # --- 50% COLUMN: Station List (one selectable table) ---
+        with col_list:
+            st.markdown('<div class="list-title-container"><h3>🏢 Station List</h3></div>', unsafe_allow_html=True)
+            if stations_df is not None:
+                render_station_list(stations_df, key='stations_tbl')
     
         # --- 50% COLUMN: Map and Metrics ---
         with col_main_content:
             col_m1, col_m2, col_m3 = st.columns(3)
             with col_m1:
-                st.metric("Total Stations", len(stations_df) if stations_df is not None else 0)
+                st.metric("Total Stations", stations_df.attrs.get('total', 0) if stations_df is not None else 0)
             with col_m2:
-                active_count = 0
-                if stations_df is not None and 'Status' in stations_df.columns:
-                    active_count = len(stations_df[stations_df['Status'].astype(str).str.lower() == 'active'])
-                st.metric("Active Stations", active_count)
+                st.metric("Active Stations", stations_df.attrs.get('active_count', 0) if stations_df is not None else 0)
             with col_m3:
                 st.metric("Dashboard Date", datetime.now().strftime("%Y-%m-%d"))
             
@@ -341,10 +327,10 @@ def main():
             
             st.markdown("<h3 style='text-align: center;'>📍 Station Locations</h3>", unsafe_allow_html=True)
             
-            station_map = create_map(stations_df)
-            if station_map:
-                # Set height to 450 to make space for the metrics and title
-                folium_static(station_map, width=None, height=450) 
+            map_html = build_map_html(stations_df)
+            if map_html:
+                # Set height to 450 (+10 for the iframe border) to make space for the metrics and title
+                st.iframe(map_html, height=460)
     
     else:
         # ----------------------------------------------------------------------
@@ -354,19 +340,7 @@ def main():
         # We use a single full-width column for the details.
         col_full_width = st.columns(1)[0]
         
-        # --- Date Formatting and Logic Helper ---
         today_date_str = datetime.now().strftime("%Y-%m-%d")
-        
-        def format_date(date_data, default_if_na=None):
-            """Formats date data to YYYY-MM-DD, handling NaT/NaN or returning default."""
-            if pd.notna(date_data):
-                try:
-                    # Handle both datetime objects and strings that might include time
-                    return pd.to_datetime(date_data).strftime("%Y-%m-%d")
-                except:
-                    return str(date_data) # Fallback if conversion fails
-            return default_if_na if default_if_na is not None else 'N/A'
-        # ----------------------------------------
 
         with col_full_width:
             station = st.session_state.selected_station
@@ -378,57 +352,8 @@ def main():
             
             st.header(f"📊 {station.get('Station Name', 'Unknown Station')}")
             
-            # 🔑 KEY ADDITION: Wrap the detail metrics in the container div
-            st.markdown("<div class='detail-metrics-container'>", unsafe_allow_html=True)
-            
-            # 📌 NEW DETAIL METRICS LAYOUT (5 Rows with 1 or 2 Columns)
-            
-            # Row 1 (Station Name - 1 column)
-            col_d1 = st.columns(1)[0]
-            with col_d1:
-                st.metric("Station Name", str(station.get('Station Name', 'N/A')))
-
-            st.markdown("---") 
-
-            # Row 2 (Adress - 1 column)
-            col_d2 = st.columns(1)[0]
-            with col_d2:
-                st.metric("Adress", str(station.get('Adress', 'N/A')))
-
-            st.markdown("---") 
-
-            # Row 3 (Type - 1 column)
-            col_d3 = st.columns(1)[0]
-            with col_d3:
-                st.metric("Type", str(station.get('Type', 'N/A')))
-
-            st.markdown("---") 
-
-            # Row 4 (Lat, Lon - 2 columns)
-            col_d4, col_d5 = st.columns(2)
-            with col_d4:
-                # Latitude formatting is numerical, so float check is okay
-                st.metric("Latitude", f"{station.get('Lat', 'N/A'):.4f}" if pd.notna(station.get('Lat')) else 'N/A')
-            with col_d5:
-                # Longitude formatting is numerical, so float check is okay
-                st.metric("Longitude", f"{station.get('Lon', 'N/A'):.4f}" if pd.notna(station.get('Lon')) else 'N/A')
-
-            st.markdown("---") 
-
-            # Row 5 (Starting Date, Last Updated - 2 columns)
-            col_d6, col_d7 = st.columns(2)
-            with col_d6:
-                starting_date_str = format_date(station.get('Starting date'))
-                st.metric("Starting Date", starting_date_str)
-            with col_d7:
-                # If Last Updated is missing/NaN, use today's date
-                last_updated_str = format_date(station.get('Last updated'), default_if_na=today_date_str)
-                st.metric("Last Updated", last_updated_str)
-            
-            st.markdown("---")
-            
-            # 🔑 KEY ADDITION: Close the container div
-            st.markdown("</div>", unsafe_allow_html=True)
+            # 📌 DETAIL LAYOUT (5 Rows with 1 or 2 fields), rendered as one HTML table
+            st.markdown(build_detail_table_html(station, today_date_str), unsafe_allow_html=True)
 
 
 if __name__ == "__main__":
@@ -1,14 +1,21 @@
 import streamlit as st
 import pandas as pd
-import plotly.graph_objects as go
-from datetime import datetime, timedelta
+from datetime import timedelta
 import folium
-from streamlit_folium import folium_static
 import os
+import numpy as np
+import json
+import re
+from excel_cache import cache_by_file_stamp, cached_read_excel, get_cache_dir, list_sheet_names
+from station_map import add_station_markers
 
 # --- Constants for Filenames ---
 LOCATION_FILE = "Location.xlsx"
 DATA_FILE = "Data.xlsx"
+MAX_POINTS_PER_TRACE = 2000  # Plotly stalls past ~20k points per trace
+BAND_BINS = 600  # Time bins (about one per horizontal pixel) for the min/max band behind dense traces
+DATA_COLUMNS = None  # Optional allowlist of Data.xlsx value columns; None keeps every numeric column
+CLUSTER_THRESHOLD = 200  # Above this many stations, markers are clustered instead of drawn individually
 
 # Page configuration
 st.set_page_config(
@@ -19,7 +26,9 @@ st.set_page_config(
 )
 
 # --- CUSTOM CSS FOR NEW LAYOUT ---
-st.markdown("""
+# Built once at import; Streamlit drops elements that a rerun does not emit, so the
+# markdown call below still runs on every rerun
+APP_CSS = """
 <style>
     /* General App styling to reduce padding */
     .block-container {
@@ -93,15 +102,6 @@ st.markdown("""
         font-size: 1.2rem;
         cursor: pointer;
     }
-    .list-subheaders {
-        display: flex;
-        justify-content: space-between;
-        color: #7f8c8d;
-        font-size: 0.9rem;
-        padding-bottom: 5px;
-        border-bottom: 1px solid #eee;
-        margin-bottom: 10px;
-    }
     .no-entities {
         text-align: center;
         color: #009688;
@@ -110,30 +110,6 @@ st.markdown("""
         margin-top: 100px;
     }
 
-    /* --- STATION LIST BUTTONS (Redesigning streamlit buttons) --- */
-    /* Target buttons inside the left column specifically */
-    [data-testid="column"]:nth-of-type(1) .stButton button {
-        width: 100%;
-        text-align: left;
-        border: none;
-        border-bottom: 1px solid #f0f0f0;
-        background-color: transparent;
-        color: #2c3e50;
-        padding: 10px 5px;
-        border-radius: 0;
-        display: flex;
-        justify-content: space-between;
-    }
-    [data-testid="column"]:nth-of-type(1) .stButton button:hover {
-        background-color: #f9f9f9;
-        color: #009688;
-        border-color: #009688;
-    }
-    [data-testid="column"]:nth-of-type(1) .stButton button p {
-        font-size: 1rem;
-        font-weight: 500;
-    }
-
     /* --- RIGHT COLUMN CONTAINER --- */
     .map-container-style {
         border: 1px solid #ddd;
@@ -142,86 +118,328 @@ st.markdown("""
         height: 600px;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+st.markdown(APP_CSS, unsafe_allow_html=True)
 
 # --- FUNCTIONS (Kept mostly the same) ---
 
-@st.cache_data
+# Chart downsampler: tsdownsample's Rust MinMax-LTTB when installed, otherwise the
+# pure NumPy LTTB below
+try:
+    from tsdownsample import NaNMinMaxLTTBDownsampler
+except ImportError:
+    NaNMinMaxLTTBDownsampler = None
+
+@cache_by_file_stamp
 def load_location_data(filepath):
     try:
-        df = pd.read_excel(filepath)
+        df = cached_read_excel(filepath)
+        # Arrow-backed columns: text lives in Arrow string arrays instead of Python objects
+        df = df.convert_dtypes(dtype_backend='pyarrow')
+        # Coordinates as plain NumPy float32: half the bytes, still ~1 m precision
+        df['Lat'] = pd.to_numeric(df['Lat'], errors='coerce').astype('float32')
+        df['Lon'] = pd.to_numeric(df['Lon'], errors='coerce').astype('float32')
+        # Lowercased type, computed once for the groundwater icon/colour checks
+        df['Type_lc'] = text_column(df, 'Type', '').str.lower()
         return df
     except Exception:
         return None
 
+def prepare_sheet(df):
+    """Parse Date once and make it a sorted DatetimeIndex so time filters can binary search.
+
+    Columns that are never plotted (anything but Date and the numeric values) are dropped.
+    """
+    if 'Date' not in df.columns:
+        return df
+    value_cols = [col for col in df.select_dtypes('number').columns if col != 'Date']
+    if DATA_COLUMNS is not None:
+        value_cols = [col for col in value_cols if col in DATA_COLUMNS]
+    df = df.loc[:, ['Date', *value_cols]]
+    df['Date'] = pd.to_datetime(df['Date'], errors='coerce')
+    # Sensor readings fit in float32 / small ints: half the bytes for every filter and plot pass
+    for col in value_cols:
+        kind = 'float' if pd.api.types.is_float_dtype(df[col]) else 'integer'
+        df[col] = pd.to_numeric(df[col], downcast=kind)
+    df = df.dropna(subset=['Date']).sort_values('Date').set_index('Date')
+    # Plotted columns, carried along (attrs survive slicing) so charts don't re-run select_dtypes
+    df.attrs['numeric_cols'] = value_cols
+    return df
+
 @st.cache_data
+def load_sheet(filepath, cache_dir, position):
+    """Parse and prepare one data sheet, cached per process so it is prepared only once.
+
+    st.cache_data hands each caller its own unpickled copy, so sessions share the parsing
+    work, not the DataFrame. cache_dir is derived from the file hash, so it also keys the
+    file version.
+    """
+    return prepare_sheet(cached_read_excel(filepath, position, cache_dir))
+
+class LazySheets:
+    """Dict-like view of a workbook that only parses a sheet the first time it is accessed.
+
+    Sheets come from the process-wide load_sheet cache (memoized again per instance) and
+    are persisted to the Parquet cache, so a sheet is read from the xlsx at most once per
+    file version.
+    """
+
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self.cache_dir = get_cache_dir(filepath)
+        self.sheet_names = self._read_sheet_names()
+        self._cache = {}
+
+    def _read_sheet_names(self):
+        index_path = os.path.join(self.cache_dir, 'sheet_names.json')
+        if os.path.exists(index_path):
+            with open(index_path) as f:
+                return json.load(f)
+
+        sheet_names = list_sheet_names(self.filepath)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(index_path, 'w') as f:
+                json.dump(sheet_names, f)
+        except OSError:
+            pass  # Cache is best-effort
+        return sheet_names
+
+    def __getitem__(self, name):
+        if name not in self.sheet_names:
+            raise KeyError(name)
+        if name not in self._cache:
+            self._cache[name] = load_sheet(self.filepath, self.cache_dir, self.sheet_names.index(name))
+        return self._cache[name]
+
+    def __contains__(self, name):
+        return name in self.sheet_names
+
+    def __iter__(self):
+        return iter(self.sheet_names)
+
+    def __len__(self):
+        return len(self.sheet_names)
+
+    def keys(self):
+        return list(self.sheet_names)
+
+@cache_by_file_stamp
 def load_data_file(filepath):
-    try:
-        xlsx = pd.ExcelFile(filepath)
-        all_data = {}
-        for sheet_name in xlsx.sheet_names:
-            all_data[sheet_name] = pd.read_excel(xlsx, sheet_name=sheet_name)
-        return all_data
-    except Exception:
-        return None
+    # Errors propagate (and are not cached) so callers can tell a failed load from no data
+    return LazySheets(filepath)
+
+def text_column(df, col, default):
+    """Return a column as strings with missing values (or a missing column) set to default."""
+    if col not in df.columns:
+        return pd.Series(default, index=df.index, dtype=object)
+    return df[col].astype(object).where(df[col].notna(), default).astype(str)
+
+def text_value(row, col, default):
+    """Return one field of a row as a string, with a missing value (or column) set to default."""
+    value = row.get(col)
+    return default if value is None or pd.isna(value) else str(value)
+
+def normalize_key(name):
+    """Normalize a sheet name or Station ID for lookups (lowercase, no punctuation)."""
+    return re.sub(r'\W+', '', str(name).lower())
+
+def build_sheet_index(all_data):
+    """Map normalized sheet names to sheet names for O(1) station lookups."""
+    if not all_data:
+        return {}
+    return {normalize_key(name): name for name in all_data.keys()}
+
+def find_station_sheet(sheet_index, station_id):
+    """Return the data sheet name for a station, falling back to a substring match."""
+    key = normalize_key(station_id)
+    if key in sheet_index:
+        return sheet_index[key]
+    return next((name for norm, name in sheet_index.items() if key and key in norm), None)
 
-def get_station_icon(station_type):
-    if pd.notna(station_type) and 'groundwater' in str(station_type).lower():
-        return "📍"
-    return "📌"
+@st.cache_data(hash_funcs={pd.DataFrame: lambda d: pd.util.hash_pandas_object(d, index=True).values.tobytes()})
+def build_station_list(stations_df):
+    """Display frame for the station list table (type icon + name, type, status), built once per data version."""
+    names = text_column(stations_df, 'Station Name ', 'Unknown')
+    types = text_column(stations_df, 'Type', '')
+    return pd.DataFrame({
+        'Station': get_station_icons(stations_df['Type_lc']) + ' ' + names,
+        'Type': types,
+        'Status': text_column(stations_df, 'Status', 'N/A'),
+    })
+
+def get_station_icons(type_lc):
+    """Return list icons for a column of lowercased station types."""
+    icons = np.where(type_lc.str.contains('groundwater', regex=False), "📍", "📌")
+    return pd.Series(icons, index=type_lc.index)
 
 def create_map(stations_df):
-    if stations_df is None or len(stations_df) == 0:
+    if stations_df is None or stations_df.empty:
         # Return a default map if no data, matching image background color roughly
-        m = folium.Map(location=[23.8, 90.4], zoom_start=7, tiles='cartodbpositron')
+        m = folium.Map(location=[23.8, 90.4], zoom_start=7, tiles='cartodbpositron', prefer_canvas=True)
         return m
     
-    center_lat = stations_df['Lat'].mean()
-    center_lon = stations_df['Lon'].mean()
-    m = folium.Map(location=[center_lat, center_lon], zoom_start=10, tiles='cartodbpositron')
+    # Drop rows without coordinates once; everything below works on complete rows only
+    valid = stations_df.dropna(subset=['Lat', 'Lon'])
+    if valid.empty:
+        return folium.Map(location=[23.8, 90.4], zoom_start=7, tiles='cartodbpositron', prefer_canvas=True)
+
+    center_lat = float(np.mean(valid['Lat'].to_numpy()))
+    center_lon = float(np.mean(valid['Lon'].to_numpy()))
+    # prefer_canvas: Leaflet draws the circle markers on one canvas instead of one SVG node each
+    m = folium.Map(location=[center_lat, center_lon], zoom_start=10, tiles='cartodbpositron', prefer_canvas=True)
     
-    for _, row in stations_df.iterrows():
-        if pd.notna(row['Lat']) and pd.notna(row['Lon']):
-            popup_html = f"<b>{row.get('Station Name ', 'Unknown')}</b><br>Status: {row.get('Status', 'N/A')}"
-            folium.Marker(
-                location=[row['Lat'], row['Lon']],
-                popup=folium.Popup(popup_html, max_width=200),
-                tooltip=row.get('Station Name ', 'Unknown'),
-                icon=folium.Icon(color='blue' if 'groundwater' in str(row.get('Type', '')).lower() else 'red')
-            ).add_to(m)
+    names = text_column(valid, 'Station Name ', 'Unknown')
+    is_groundwater = valid['Type_lc'].str.contains('groundwater', regex=False)
+    markers = pd.DataFrame({
+        'Lat': valid['Lat'], 'Lon': valid['Lon'],
+        'name': names,
+        'status': text_column(valid, 'Status', 'N/A'),
+        'color': np.where(is_groundwater, 'blue', 'red'),
+        'tooltip': names,
+    })
+    add_station_markers(m, markers, {'Station': 'name', 'Status': 'status'}, CLUSTER_THRESHOLD)
     return m
 
+@st.cache_data(hash_funcs={pd.DataFrame: lambda d: pd.util.hash_pandas_object(d, index=True).values.tobytes()})
+def render_map_html(stations_df):
+    """Build the station map and return its rendered HTML, reused across reruns."""
+    return folium.Figure().add_child(create_map(stations_df)).render()
+
 def filter_data_by_days(df, days):
-    if df is None or len(df) == 0 or 'Date' not in df.columns: return df
-    df['Date'] = pd.to_datetime(df['Date'], errors='coerce')
-    df = df.dropna(subset=['Date'])
-    if len(df) == 0: return df
-    latest_date = df['Date'].max()
+    # Sheets arrive sorted on a DatetimeIndex (see prepare_sheet), so the window is a binary search
+    if df is None or df.empty or not isinstance(df.index, pd.DatetimeIndex): return df
+    latest_date = df.index[-1]
     cutoff_date = latest_date - timedelta(days=days)
-    return df[df['Date'] >= cutoff_date]
+    return df.iloc[df.index.searchsorted(cutoff_date):]
+
+def lttb_indices(x, y, n_out):
+    """Largest-Triangle-Three-Buckets in NumPy: indices of n_out points that keep the shape of y."""
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = x.astype('float64')  # int64 nanoseconds would overflow in the area products
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    idx = np.empty(n_out, dtype=np.int64)
+    idx[0], idx[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x, avg_y = x[end:next_end].mean(), y[end:next_end].mean()
+        # Keep the point forming the largest triangle with the last kept point and the next bucket's mean
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        idx[i + 1] = a
+    return idx
+
+def downsample_trace(dates, values, n_out=MAX_POINTS_PER_TRACE):
+    """Reduce one trace to n_out visually representative points with MinMax-LTTB.
+
+    NaN gaps are kept so Plotly still breaks the line where readings are missing; the
+    NumPy fallback only samples the non-NaN readings.
+    """
+    if len(values) <= n_out:
+        return dates, values
+    x = dates.to_numpy().astype('datetime64[ns]').astype('int64')
+    y = values.to_numpy(dtype='float64')
+    if NaNMinMaxLTTBDownsampler is not None:
+        idx = NaNMinMaxLTTBDownsampler().downsample(x, y, n_out=n_out)
+    else:
+        valid = np.flatnonzero(~np.isnan(y))
+        idx = valid[lttb_indices(x[valid], y[valid], n_out)]
+    return dates[idx], values.iloc[idx]
+
+def minmax_band(dates, values, n_bins=BAND_BINS):
+    """Per-bin min and max of one trace over n_bins equal time bins, for a translucent range band."""
+    x = dates.as_unit('ns').asi8
+    edges = np.linspace(x[0], x[-1], n_bins + 1)
+    bins = np.clip(np.searchsorted(edges, x, side='right') - 1, 0, n_bins - 1)
+    grouped = values.groupby(bins)
+    lo, hi = grouped.min(), grouped.max()
+    centers = pd.to_datetime(((edges[:-1] + edges[1:]) / 2)[lo.index].astype('int64'))
+    return centers, lo.to_numpy(), hi.to_numpy()
 
+def hex_to_rgba(color, alpha):
+    r, g, b = (int(color[i:i + 2], 16) for i in (1, 3, 5))
+    return f"rgba({r}, {g}, {b}, {alpha})"
+
+@st.cache_data(hash_funcs={pd.DataFrame: lambda d: pd.util.hash_pandas_object(d).values.tobytes()})
 def create_time_series_chart(data, station_name, days):
-    if data is None or len(data) == 0: return None
-    numeric_cols = data.select_dtypes(include=['float64', 'int64']).columns.tolist()
-    if len(numeric_cols) == 0: return None
+    if data is None or data.empty: return None
+    numeric_cols = data.attrs.get('numeric_cols') or data.select_dtypes('number').columns.tolist()
+    if not numeric_cols or not isinstance(data.index, pd.DatetimeIndex): return None
     
+    # Imported here: plotly is slow to import and only the detail view draws charts
+    import plotly.graph_objects as go
     fig = go.Figure()
     colors = ['#009688', '#f39c12', '#2ecc71', '#9b59b6']
     for idx, col in enumerate(numeric_cols):
-        fig.add_trace(go.Scatter(
-            x=data['Date'], y=data[col], mode='lines+markers', name=col,
-            line=dict(color=colors[idx % len(colors)], width=2), marker=dict(size=4)
+        color = colors[idx % len(colors)]
+        if len(data) > MAX_POINTS_PER_TRACE:
+            # Dense window: shade the per-bin min/max range so extremes dropped by the
+            # downsampled line still show
+            band_x, lo, hi = minmax_band(data.index, data[col])
+            fig.add_trace(go.Scatter(
+                x=band_x, y=hi, mode='lines', line=dict(width=0), hoverinfo='skip', showlegend=False
+            ))
+            fig.add_trace(go.Scatter(
+                x=band_x, y=lo, mode='lines', line=dict(width=0), fill='tonexty',
+                fillcolor=hex_to_rgba(color, 0.2), hoverinfo='skip', showlegend=False
+            ))
+        x, y = downsample_trace(data.index, data[col])
+        # WebGL trace; markers only add clutter once a trace is dense
+        fig.add_trace(go.Scattergl(
+            x=x, y=y, mode='lines' if len(x) > 500 else 'lines+markers', name=col,
+            line=dict(color=color, width=2), marker=dict(size=4)
         ))
     
     fig.update_layout(
         title=f"Last {days} Days Data", xaxis_title="Date", yaxis_title="Value",
         hovermode='x unified', height=400, template='plotly_white',
         margin=dict(l=20, r=20, t=40, b=20),
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        uirevision=f"fig-{station_name}"  # Keep pan/zoom when the same station's chart is redrawn
     )
     return fig
 
 # --- MAIN APP ---
+@st.fragment
+def render_station_chart(station):
+    """Time-range selector and chart for one station, rerun on its own as a fragment."""
+    # Chart Controls
+    days = st.selectbox("Time Range", options=[30, 90, 365], index=1)
+
+    # Chart Rendering
+    if st.session_state.data_df is None and os.path.exists(DATA_FILE):
+        try:
+            st.session_state.data_df = load_data_file(DATA_FILE)
+        except Exception as e:
+            # Empty, not None, so the broken workbook is not re-opened on every rerun
+            st.session_state.data_df = {}
+            st.error(f"Error loading {DATA_FILE}: {e}")
+        st.session_state.data_index = build_sheet_index(st.session_state.data_df)
+
+    if st.session_state.data_index:
+        matching_sheet = find_station_sheet(st.session_state.data_index, text_value(station, 'Station ID', ''))
+                
+        if matching_sheet is not None:
+            # Read-only from here on: filter_data_by_days returns a slice, no copy needed
+            data = st.session_state.data_df[matching_sheet]
+            filtered_data = filter_data_by_days(data, days)
+            if not filtered_data.empty:
+                fig = create_time_series_chart(filtered_data, text_value(station, 'Station Name ', 'Unknown'), days)
+                if fig is None:
+                    # e.g. a sheet without a Date column or without numeric readings
+                    st.info("No time series to plot for this station.")
+                else:
+                    st.plotly_chart(fig, width='stretch')
+            else:
+                st.info(f"No data in last {days} days.")
+        else:
+            st.warning("No data sheet found for this station.")
+
 def main():
     # 1. INJECT CUSTOM HEADER HTML
     st.markdown("""
@@ -249,16 +467,20 @@ def main():
     # 3. LOAD DATA
     if 'stations_data' not in st.session_state: st.session_state.stations_data = None
     if 'data_df' not in st.session_state: st.session_state.data_df = None
-    if 'selected_station' not in st.session_state: st.session_state.selected_station = None
+    if 'data_index' not in st.session_state: st.session_state.data_index = {}
+    if 'selected_idx' not in st.session_state: st.session_state.selected_idx = None  # Row position, not a row copy
+    if 'list_nonce' not in st.session_state: st.session_state.list_nonce = 0
+    st.session_state.setdefault('_loaded', False)
 
-    data_loaded = False
-    if os.path.exists(LOCATION_FILE) and os.path.exists(DATA_FILE):
-        if st.session_state.stations_data is None:
-            st.session_state.stations_data = load_location_data(LOCATION_FILE)
-            st.session_state.data_df = load_data_file(DATA_FILE)
-        
-        if st.session_state.stations_data is not None and len(st.session_state.stations_data) > 0:
-            data_loaded = True
+    # Load once per session: a failed load is not retried on every rerun.
+    # DATA_FILE is only opened once a station's details are shown, so a missing or
+    # slow data workbook never holds up the map view
+    if not st.session_state._loaded and os.path.exists(LOCATION_FILE):
+        st.session_state.stations_data = load_location_data(LOCATION_FILE)
+        st.session_state._loaded = True
+
+    stations = st.session_state.stations_data
+    data_loaded = stations is not None and not stations.empty
 
     # 4. TWO-COLUMN LAYOUT
     # Adjust ratios to match image (left col is narrower)
@@ -272,22 +494,22 @@ def main():
                 <div class="list-title">Station list</div>
                 <div class="list-icons">🔍 ⛶</div>
             </div>
-            <div class="list-subheaders">
-                <span>Station Name ↑</span>
-                <span>Device Location</span>
-            </div>
         """, unsafe_allow_html=True)
 
         if data_loaded:
-            # Display list of stations as clickable buttons styled like list items
-            # Using a container with fixed height for scrolling if many stations
-            with st.container(height=550, border=False):
-                for idx, station in st.session_state.stations_data.iterrows():
-                    s_name = station.get('Station Name ', 'Unknown')
-                    # Create a button that acts as a list item select
-                    if st.button(f"📍 {s_name}", key=f"btn_{idx}", use_container_width=True):
-                        st.session_state.selected_station = station
-                        st.rerun()
+            # The whole station list is one selectable table; a new key after "Back"
+            # starts it without a selected row
+            event = st.dataframe(
+                build_station_list(st.session_state.stations_data),
+                width='stretch',
+                height=550,
+                hide_index=True,
+                on_select='rerun',
+                selection_mode='single-row',
+                key=f"stations_tbl_{st.session_state.list_nonce}",
+            )
+            if event.selection.rows:
+                st.session_state.selected_idx = event.selection.rows[0]
         else:
             # Show the "No entities found" message if no data exist
             st.markdown('<div class="no-entities">No entities found</div>', unsafe_allow_html=True)
@@ -297,50 +519,36 @@ def main():
         # Add a subtle container style around right column content
         st.markdown('<div class="map-container-style">', unsafe_allow_html=True)
         
-        if st.session_state.selected_station is None:
+        if st.session_state.selected_idx is None:
             # SHOW MAP VIEW (Default state matching image)
             map_data = st.session_state.stations_data if data_loaded else None
-            station_map = create_map(map_data)
-            folium_static(station_map, width="100%", height=590)
+            # Map HTML is cached, so reruns skip rebuilding and re-rendering the folium map
+            st.iframe(render_map_html(map_data), height=600)
             
         else:
             # SHOW DETAILS VIEW (If a station is clicked in left column)
-            station = st.session_state.selected_station
+            station = st.session_state.stations_data.iloc[st.session_state.selected_idx]
             
             # Header with Back Button
             c1, c2 = st.columns([1, 5])
             with c1:
-                 if st.button("← Back", use_container_width=True):
-                    st.session_state.selected_station = None
+                 if st.button("← Back", width='stretch'):
+                    st.session_state.selected_idx = None
+                    st.session_state.list_nonce += 1  # Fresh list table, so the old row is not re-selected
                     st.rerun()
             with c2:
-                 st.subheader(f"📊 {station.get('Station Name ', 'Unknown')}")
+                 st.subheader(f"📊 {text_value(station, 'Station Name ', 'Unknown')}")
 
             # Metrics
             m1, m2, m3 = st.columns(3)
-            m1.metric("ID", station.get('Station ID', 'N/A'))
-            m2.metric("Type", station.get('Type', 'N/A'))
-            m3.metric("Status", station.get('Status', 'N/A'))
+            # Arrow-backed fields come back as pd.NA when blank, which st.metric rejects
+            m1.metric("ID", text_value(station, 'Station ID', 'N/A'))
+            m2.metric("Type", text_value(station, 'Type', 'N/A'))
+            m3.metric("Status", text_value(station, 'Status', 'N/A'))
             st.markdown("---")
 
-            # Chart Controls
-            days = st.selectbox("Time Range", options=[30, 90, 365], index=1)
-
-            # Chart Rendering
-            if st.session_state.data_df:
-                station_id = str(station.get('Station ID', '')).lower()
-                matching_sheet = next((sheet for sheet in st.session_state.data_df.keys() if station_id in str(sheet).lower()), None)
-                
-                if matching_sheet:
-                    data = st.session_state.data_df[matching_sheet].copy()
-                    filtered_data = filter_data_by_days(data, days)
-                    if len(filtered_data) > 0:
-                        fig = create_time_series_chart(filtered_data, station.get('Station Name '), days)
-                        st.plotly_chart(fig, use_container_width=True)
-                    else:
-                        st.info(f"No data in last {days} days.")
-                else:
-                    st.warning("No data sheet found for this station.")
+            # Changing the time range reruns only this fragment, not the list or header
+            render_station_chart(station)
 
         st.markdown('</div>', unsafe_allow_html=True) # End map-container-style
 
@@ -0,0 +1,60 @@
+"""Station marker layers shared by the dashboards' folium maps."""
+import folium
+from folium.plugins import FastMarkerCluster
+import pandas as pd
+
+# Leaflet marker factory for FastMarkerCluster; rows are [lat, lon, popup, color, tooltip]
+CLUSTER_CALLBACK = """
+function (row) {
+    var marker = L.circleMarker(new L.LatLng(row[0], row[1]), {
+        radius: 6, color: row[3], fillColor: row[3], fill: true, fillOpacity: 0.8
+    });
+    marker.bindPopup(row[2], {maxWidth: 250});
+    marker.bindTooltip(row[4]);
+    return marker;
+}
+"""
+
+def add_station_markers(m, stations, popup_fields, cluster_threshold):
+    """Add a circle marker per station to a folium map.
+
+    stations holds Lat, Lon, color and tooltip columns plus the text columns named in
+    popup_fields, a {label: column} dict. Popups and tooltips are always built in the
+    browser, so no station costs a folium.Popup template render.
+    """
+    if len(stations) > cluster_threshold:
+        # Many stations: cluster them and let the browser create the markers from plain rows
+        popups = None
+        for label, col in popup_fields.items():
+            line = f'<b>{label}:</b> ' + stations[col]
+            popups = line if popups is None else popups + '<br>' + line
+        marker_data = pd.DataFrame({
+            'Lat': stations['Lat'], 'Lon': stations['Lon'],
+            'popup': popups, 'color': stations['color'], 'tooltip': stations['tooltip'],
+        })
+        FastMarkerCluster(marker_data, callback=CLUSTER_CALLBACK).add_to(m)
+        return
+
+    # Ship all stations as one GeoJSON layer; popups and tooltips are built from feature
+    # properties in the browser instead of one folium.Marker + folium.Popup per station
+    fields = list(popup_fields.values())
+    properties = stations[[*fields, 'tooltip', 'color']].to_dict('records')
+    features = [
+        {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [float(lon), float(lat)]},
+            "properties": props,
+        }
+        for lat, lon, props in zip(stations['Lat'].to_numpy(), stations['Lon'].to_numpy(), properties)
+    ]
+    folium.GeoJson(
+        {"type": "FeatureCollection", "features": features},
+        name='Stations',
+        marker=folium.CircleMarker(radius=6, fill=True, fill_opacity=0.8),
+        style_function=lambda feature: {
+            "color": feature["properties"]["color"],
+            "fillColor": feature["properties"]["color"],
+        },
+        tooltip=folium.GeoJsonTooltip(fields=["tooltip"], labels=False),
+        popup=folium.GeoJsonPopup(fields=fields, aliases=list(popup_fields), max_width=250),
+    ).add_to(m)